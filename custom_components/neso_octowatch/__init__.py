@@ -1,27 +1,113 @@
 """The Octopus DFS Session Watch integration."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-import json
-from datetime import datetime, timedelta
-from urllib import parse
-import pandas as pd
-import requests
+import random
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, NamedTuple
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    PLATFORMS,
+)
 
 LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.SENSOR]
+_UTC = timezone.utc
+
+_API_URL = 'https://api.neso.energy/api/3/action/datastore_search_sql'
+_HEADERS = {'User-Agent': 'neso_octowatch/1.0'}
+_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Transient datastore errors (409 under load, rate limiting, gateway errors)
+# are retried a few times before the poll gives up
+_RETRY_STATUSES = frozenset({409, 429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.5
+_MAX_RETRY_DELAY = 10.0
+
+# Octopus rows feed the price, volume and time window sensors; other
+# participants only matter for upcoming sessions and the latest delivery date.
+# Only the columns the sensors read are selected.
+_UTILIZATION_SQL = (
+    'SELECT "_id", "Delivery Date", "From", "To", "Registered DFS Participant", '
+    '"Status", "Utilisation Price GBP per MWh", "DFS Volume MW" '
+    'FROM "cc36fff5-5f6f-4fde-8932-c935d982ecd8" '
+    'WHERE "Registered DFS Participant" = \'OCTOPUS ENERGY LIMITED\' '
+    'OR "Delivery Date" >= \'{today}\' OR "Delivery Date" = ('
+    'SELECT MAX("Delivery Date") FROM "cc36fff5-5f6f-4fde-8932-c935d982ecd8") '
+    'ORDER BY "_id" ASC LIMIT 1000'
+)
+# Only the latest delivery date and any from today onwards are used, so let
+# the datastore drop older sessions
+_BIDS_SQL = (
+    'SELECT * FROM "f5605e2b-b677-424c-8df7-d0ce4ee03cef" '
+    'WHERE "Participant Bids Eligible" LIKE \'%OCTOPUS ENERGY LIMITED%\' '
+    'AND ("Delivery Date" >= \'{today}\' OR "Delivery Date" = ('
+    'SELECT MAX("Delivery Date") FROM "f5605e2b-b677-424c-8df7-d0ce4ee03cef" '
+    'WHERE "Participant Bids Eligible" LIKE \'%OCTOPUS ENERGY LIMITED%\')) '
+    'ORDER BY "_id" ASC LIMIT 1000'
+)
+
+class _CachedResponse(NamedTuple):
+    """Last datastore response for one dataset."""
+
+    sql_query: str
+    validators: dict[str, str]
+    digest: bytes
+    json_response: Any
+
+@lru_cache(maxsize=4)
+def _build_time_slots(slots, today):
+    """Build the time slot summary from (date, from, to, MW, price) tuples."""
+    # Sort and get most recent date, undated slots last
+    slots_sorted = sorted(
+        slots, key=lambda slot: (slot[0] is None, slot[0] or datetime.min, slot[1] or '')
+    )
+    dates = [slot[0] for slot in slots_sorted if slot[0] is not None]
+    if not dates:
+        return "No entries found"
+    LOGGER.debug("Available delivery dates: %s", list(dict.fromkeys(dates)))
+    # Try to get the nearest future date
+    future_dates = [d for d in dates if d >= today]
+    if future_dates:
+        most_recent_date = min(future_dates)
+    else:
+        # If no future dates, get the most recent past date
+        most_recent_date = max(dates)
+    LOGGER.debug("Selected delivery date: %s", most_recent_date)
+    
+    time_slots = []
+    time_slots.append(f"\n**{most_recent_date}**")
+    
+    for delivery_date, time_from, time_to, requirement, price in slots_sorted:
+        if delivery_date != most_recent_date:
+            continue
+        period = f"• {time_from} - {time_to}"
+        if requirement is not None:
+            period += f" ({requirement} MW)"
+        if price is not None:
+            period += f" with a guaranteed acceptance price of £{price}/MWh"
+        time_slots.append(period)
+    
+    return "\n".join(time_slots)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Octopus DFS Session Watch component."""
@@ -31,8 +117,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Octopus DFS Session Watch from a config entry."""
     coordinator = DfsSessionWatchCoordinator(hass, entry)
-    # Force an immediate refresh before setting up sensors
-    await coordinator.async_refresh()
+    # Fetch initial data once before setting up sensors
+    await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -52,135 +138,255 @@ class DfsSessionWatchCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
+        base_interval = timedelta(
+            seconds=entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
+        )
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(
-                seconds=entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
-            ),
+            update_interval=base_interval,
         )
         self.entry = entry
+        # Home Assistant's shared session keeps connections alive between polls
+        self._session = async_get_clientsession(hass)
+        self._base_interval = base_interval
+        self._max_interval = max(
+            base_interval,
+            timedelta(
+                seconds=entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+            ),
+        )
+        # Raw API records per dataset, used to detect unchanged polls
+        self._fetched_records = {}
+        self._previous_records = {}
+        # Last response per dataset, for conditional GETs and unchanged bodies
+        self._cached_responses = {}
 
     async def _async_update_data(self):
         """Fetch data from NESO API."""
-        try:
-            bids_data = await self.hass.async_add_executor_job(self._check_octopus_bids)
-            utilization_data = await self.hass.async_add_executor_job(self._check_utilization)
-            # Merge the two dictionaries
-            return {**bids_data, **utilization_data}
-        except Exception as e:
-            LOGGER.error("Error fetching data from NESO API: %s", e)
-            return {}
+        self._fetched_records = {}
+        # Both checks handle and log their own errors, so run them side by side
+        bids_data, utilization_data = await asyncio.gather(
+            self._async_check_octopus_bids(),
+            self._async_check_utilization(),
+        )
+        self._adapt_update_interval()
+        # Merge the two dictionaries
+        return {**bids_data, **utilization_data}
+
+    def _adapt_update_interval(self) -> None:
+        """Back off while both datasets are unchanged, reset once either changes."""
+        unchanged = (
+            len(self._fetched_records) == 2
+            and self._fetched_records == self._previous_records
+        )
+        self._previous_records = self._fetched_records
+        if unchanged:
+            self.update_interval = min(self.update_interval * 2, self._max_interval)
+        else:
+            self.update_interval = self._base_interval
+        LOGGER.debug("Next NESO poll in %s", self.update_interval)
+
+    async def _async_fetch(self, dataset, sql_query):
+        """Run a datastore SQL query and return the parsed JSON."""
+        # Cached responses only hold for the exact query they were issued for
+        cached = self._cached_responses.get(dataset)
+        if cached is not None and cached.sql_query != sql_query:
+            cached = None
+        # Revalidate the last response so an unchanged dataset comes back as
+        # an empty 304 instead of the full body
+        headers = _HEADERS if cached is None else {**_HEADERS, **cached.validators}
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            async with self._session.get(
+                _API_URL,
+                params={'sql': sql_query},
+                headers=headers,
+                timeout=_TIMEOUT,
+            ) as response:
+                if response.status in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS:
+                    delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                    LOGGER.debug(
+                        "NESO %s query returned HTTP %s, retrying in %.1fs",
+                        dataset, response.status, delay,
+                    )
+                else:
+                    if response.status == 304 and cached is not None:
+                        LOGGER.debug("NESO %s data not modified, reusing the previous response", dataset)
+                        return cached.json_response
+                    response.raise_for_status()
+                    body = await response.read()
+                    # The datastore does not always send validators, so fall back to
+                    # comparing a digest of the body before parsing it again
+                    digest = hashlib.blake2b(body, digest_size=16).digest()
+                    if cached is not None and cached.digest == digest:
+                        LOGGER.debug("NESO %s response unchanged, reusing the parsed body", dataset)
+                        json_response = cached.json_response
+                    else:
+                        json_response = json_loads(body)
+                    break
+            await asyncio.sleep(delay)
+
+        validators = {}
+        if etag := response.headers.get('ETag'):
+            validators['If-None-Match'] = etag
+        if last_modified := response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = last_modified
+        self._cached_responses[dataset] = _CachedResponse(
+            sql_query, validators, digest, json_response
+        )
+        return json_response
 
-    def _check_utilization(self):
+    @staticmethod
+    def _retry_delay(attempt, retry_after):
+        """Return the wait before the next attempt, honouring Retry-After."""
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_DELAY)
+        # Exponential backoff with jitter so retries don't arrive in lockstep
+        delay = _RETRY_BACKOFF * 2 ** (attempt - 1)
+        return min(delay + random.uniform(0, delay), _MAX_RETRY_DELAY)
+
+    async def _async_check_utilization(self):
         """Check utilization data from NESO API."""
-        sql_query = 'SELECT * FROM "cc36fff5-5f6f-4fde-8932-c935d982ecd8" ORDER BY "_id" ASC LIMIT 1000'
-        params = {'sql': sql_query}
+        sql_query = _UTILIZATION_SQL.format(today=datetime.now().date().isoformat())
 
         try:
             # Debug log to verify the exact query being sent
             LOGGER.debug("Sending SQL query: %s", sql_query)
             
-            response = requests.get(
-                'https://api.neso.energy/api/3/action/datastore_search_sql', 
-                params=params,
-                headers={'User-Agent': 'neso_octowatch/1.0'}
-            )
-            
-            if response.status_code == 409:
-                LOGGER.warning("NESO API Conflict error. This might be due to rate limiting or API changes.")
-                return {}
-                
-            response.raise_for_status()
-            json_response = response.json()
+            json_response = await self._async_fetch("utilization", sql_query)
             
             if not json_response.get('success'):
                 LOGGER.error("NESO API Error: %s", json_response.get('error', 'Unknown error'))
                 return {}
             
             data = json_response["result"]
-            df = pd.DataFrame(data["records"])
-            
-            if df.empty:
-                return {}
+            self._fetched_records["utilization"] = data["records"]
+            return self._process_utilization(data["records"])
             
-            # Debug logging for DataFrame contents
-            LOGGER.debug("DataFrame columns: %s", df.columns.tolist())
-            LOGGER.debug("Status values in DataFrame: %s", df['Status'].unique() if 'Status' in df.columns else "No Status column")
-            LOGGER.debug("DataFrame head: %s", df.head().to_dict('records'))
-            
-            # Get the most recent entry
-            latest = df.iloc[0]
-            # Convert and sort dates
-            df['Delivery Date'] = pd.to_datetime(df['Delivery Date'])
-            
-            # Filter for dates from today onwards
-            today = pd.Timestamp.now().normalize()
-            future_df = df[df['Delivery Date'] >= today]
-            
-            # Use the earliest future date or most recent past date if no future dates
-            latest = future_df.iloc[0] if not future_df.empty else df.iloc[0]
-            
-            # Filter Octopus-specific data
-            octopus_df = df[df['Registered DFS Participant'] == 'OCTOPUS ENERGY LIMITED']
-            octopus_latest = octopus_df.iloc[0] if not octopus_df.empty else None
-            
-            # Find highest accepted bid
-            # Sort by delivery date in ASCending order
-            df = df.sort_values('Delivery Date', ascending=False)
-            
-            # Get the most recent date
-            most_recent_date = df['Delivery Date'].iloc[0] if not df.empty else None
-            LOGGER.debug("Most recent date in dataset: %s", most_recent_date)
-            
-            highest_accepted = None
+        except Exception as e:
+            LOGGER.error(
+                "Error checking utilization from %s: %s",
+                _API_URL,
+                str(e))
+            return {
+                "octopus_dfs_session_utilization": {
+                    "state": "error",
+                    "attributes": {
+                        "last_checked": datetime.now().isoformat(),
+                        "error": str(e)
+                    }
+                }
+            }
             
-            if most_recent_date is not None:
-                # Get all bids for the most recent date
-                recent_bids = df[df['Delivery Date'] == most_recent_date]
-                # Filter for accepted bids
-                accepted_bids = recent_bids[recent_bids['Status'].str.upper().str.contains('ACCEPTED', na=False)]
-                
-                if not accepted_bids.empty:
-                    # Get the highest price among accepted bids
-                    highest_accepted = accepted_bids.loc[accepted_bids['Utilisation Price GBP per MWh'].astype(float).idxmax()]
+    def _process_utilization(self, records):
+        """Build the utilization sensor states from the datastore records."""
+        if not records:
+            return {}
+        
+        # Several debug arguments are built from the records, so only
+        # compute them when debug logging is actually enabled
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
 
-            LOGGER.debug("Recent date bids count: %d, Accepted bids: %d", len(recent_bids) if 'recent_bids' in locals() else 0, len(accepted_bids) if 'accepted_bids' in locals() else 0)
+        # Debug logging for record contents
+        if debug:
+            LOGGER.debug("Record fields: %s", list(records[0]))
+            LOGGER.debug("Status values in records: %s", list(dict.fromkeys(r.get('Status') for r in records)))
+            LOGGER.debug("First records: %s", records[:5])
+        
+        # Parse delivery dates and numbers once, leaving the raw API records
+        # untouched, so the comparisons below work on native values
+        rows = [
+            {
+                **record,
+                'Delivery Date': self._parse_date(record.get('Delivery Date')),
+                'Utilisation Price GBP per MWh': self._parse_float(record.get('Utilisation Price GBP per MWh')),
+                'DFS Volume MW': self._parse_float(record.get('DFS Volume MW')),
+            }
+            for record in records
+        ]
+        
+        # Filter for dates from today onwards
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        future_rows = [
+            row for row in rows
+            if row['Delivery Date'] is not None and row['Delivery Date'] >= today
+        ]
+        
+        # Use the earliest future date or most recent past date if no future dates
+        latest = future_rows[0] if future_rows else rows[0]
+        
+        # Filter Octopus-specific data
+        octopus_rows = [
+            row for row in rows
+            if row.get('Registered DFS Participant') == 'OCTOPUS ENERGY LIMITED'
+        ]
+        octopus_latest = octopus_rows[0] if octopus_rows else None
+        
+        # Find highest accepted bid on the most recent date
+        most_recent_date = max(
+            (row['Delivery Date'] for row in rows if row['Delivery Date'] is not None),
+            default=None,
+        )
+        LOGGER.debug("Most recent date in dataset: %s", most_recent_date)
+        
+        highest_accepted = None
+        recent_bids = []
+        accepted_bids = []
+        
+        if most_recent_date is not None:
+            # Get all bids for the most recent date
+            recent_bids = [row for row in rows if row['Delivery Date'] == most_recent_date]
+            # Filter for accepted bids
+            accepted_bids = [
+                row for row in recent_bids
+                if isinstance(row.get('Status'), str) and 'ACCEPTED' in row['Status'].upper()
+            ]
+            # Get the highest price among accepted bids
+            highest_accepted = max(
+                (row for row in accepted_bids if row.get('Utilisation Price GBP per MWh') is not None),
+                key=lambda row: row['Utilisation Price GBP per MWh'],
+                default=None,
+            )
 
+        if debug:
+            LOGGER.debug("Recent date bids count: %d, Accepted bids: %d", len(recent_bids), len(accepted_bids))
             LOGGER.debug("Initial data fetch. Processing today's bids...")
             LOGGER.debug("Number of accepted bids today: %s", len(accepted_bids))
-            LOGGER.debug("Accepted bids participants: %s", accepted_bids['Registered DFS Participant'].unique() if not accepted_bids.empty else "No accepted bids")
-            LOGGER.debug("Market accepted bids prices: %s", accepted_bids['Utilisation Price GBP per MWh'].tolist() if not accepted_bids.empty else "No accepted bids")
-            LOGGER.debug("Raw DataFrame head: %s", df.head().to_dict())
-            
-            if highest_accepted is not None:
-                LOGGER.debug("Selected highest bid price: %s", highest_accepted['Utilisation Price GBP per MWh'])
-                LOGGER.debug("Selected bid delivery date: %s", highest_accepted['Delivery Date'])
-                LOGGER.debug("Highest accepted bid from participant: %s", highest_accepted['Registered DFS Participant'])
-                LOGGER.debug("Found highest accepted bid: %s GBP/MWh", highest_accepted['Utilisation Price GBP per MWh'])
-            else:
-                LOGGER.warning("No accepted bids found for the most recent date")
+            LOGGER.debug("Accepted bids participants: %s", list(dict.fromkeys(r.get('Registered DFS Participant') for r in accepted_bids)) if accepted_bids else "No accepted bids")
+            LOGGER.debug("Market accepted bids prices: %s", [r.get('Utilisation Price GBP per MWh') for r in accepted_bids] if accepted_bids else "No accepted bids")
+            LOGGER.debug("First rows: %s", rows[:5])
+        
+        if highest_accepted is not None:
+            LOGGER.debug("Selected highest bid price: %s", highest_accepted['Utilisation Price GBP per MWh'])
+            LOGGER.debug("Selected bid delivery date: %s", highest_accepted['Delivery Date'])
+            LOGGER.debug("Highest accepted bid from participant: %s", highest_accepted.get('Registered DFS Participant'))
+            LOGGER.debug("Found highest accepted bid: %s GBP/MWh", highest_accepted['Utilisation Price GBP per MWh'])
+        else:
+            LOGGER.warning("No accepted bids found for the most recent date")
+        
+        # Get Octopus-specific status
+        status = octopus_latest.get('Status', 'UNKNOWN') if octopus_latest is not None else 'UNKNOWN'
             
-            # Get Octopus-specific status
-            status = octopus_latest.get('Status', 'UNKNOWN') if octopus_latest is not None else 'UNKNOWN'
-                
-            LOGGER.debug("All dates in dataset: %s", df['Delivery Date'].unique())
+        if debug:
+            LOGGER.debug("All dates in dataset: %s", list(dict.fromkeys(r['Delivery Date'] for r in rows)))
             LOGGER.debug("Today's date: %s", today)
-            LOGGER.debug("All Octopus dates: %s", octopus_df['Delivery Date'].unique() if not octopus_df.empty else "No Octopus entries")
-            LOGGER.debug("Future dates available: %s", future_df['Delivery Date'].unique() if not future_df.empty else "None")
-            LOGGER.debug("Octopus future dates: %s", 
-                octopus_df[octopus_df['Delivery Date'] >= today]['Delivery Date'].unique() if not octopus_df.empty else "No future Octopus dates")
-            
-            # Use the most recent date from any participant for delivery_date
-            most_recent_date = df['Delivery Date'].max()
-            LOGGER.debug("Most recent session date (any participant): %s", most_recent_date)
-            
-            # For other fields, still use Octopus-specific data
-            delivery_date = most_recent_date
-            
+            LOGGER.debug("All Octopus dates: %s", list(dict.fromkeys(r['Delivery Date'] for r in octopus_rows)) if octopus_rows else "No Octopus entries")
+            LOGGER.debug("Future dates available: %s", list(dict.fromkeys(r['Delivery Date'] for r in future_rows)) if future_rows else "None")
+            LOGGER.debug("Octopus future dates: %s",
+                list(dict.fromkeys(r['Delivery Date'] for r in octopus_rows if r['Delivery Date'] is not None and r['Delivery Date'] >= today)) if octopus_rows else "No future Octopus dates")
+        
+        # Use the most recent date from any participant for delivery_date
+        LOGGER.debug("Most recent session date (any participant): %s", most_recent_date)
+        
+        # For other fields, still use Octopus-specific data
+        delivery_date = most_recent_date
+        
+        if debug:
             # Get Octopus bid for this date if it exists
-            octopus_latest_for_date = octopus_df[octopus_df['Delivery Date'] == most_recent_date].iloc[0] if not octopus_df[octopus_df['Delivery Date'] == most_recent_date].empty else None
+            octopus_latest_for_date = next(
+                (r for r in octopus_rows if r['Delivery Date'] == most_recent_date), None
+            )
             LOGGER.debug("Found Octopus bid for most recent date: %s", "Yes" if octopus_latest_for_date is not None else "No")
             
             if highest_accepted is not None:
@@ -190,158 +396,142 @@ class DfsSessionWatchCoordinator(DataUpdateCoordinator):
                 status,
                 {k: v for k, v in latest.items() if k in ['Status', 'Delivery Date', 'From', 'To']}
             )
-            
-            states = {
-                "octopus_dfs_session_utilization": {
-                    "state": status,
-                    "attributes": {
-                        "last_checked": datetime.now().isoformat(),
-                    }
-                },
-                "octopus_dfs_session_delivery_date": {
-                    "state": self._convert_to_serializable(delivery_date),
-                    "attributes": {
-                        "raw_date": delivery_date,
-                        "time_from": self._convert_to_serializable(latest.get('From')),
-                        "time_to": self._convert_to_serializable(latest.get('To')),
-                        "volume": self._convert_to_serializable(octopus_latest.get('DFS Volume MW')) if octopus_latest is not None else None,
-                        "last_update": datetime.now().isoformat()
-                    }
-                },
-                "octopus_dfs_session_highest_accepted": {
-                    "state": (
-                        highest_accepted['Utilisation Price GBP per MWh']
-                        if highest_accepted is not None and pd.notna(highest_accepted['Utilisation Price GBP per MWh'])
-                        else None
-                    ),
-                    "attributes": {} if highest_accepted is None else {
-                        "delivery_date": self._convert_to_serializable(highest_accepted['Delivery Date']) if highest_accepted is not None else None,
-                        "time_from": self._convert_to_serializable(highest_accepted['From']) if highest_accepted is not None else None,
-                        "time_to": self._convert_to_serializable(highest_accepted['To']) if highest_accepted is not None else None,
-                        "volume": self._convert_to_serializable(highest_accepted['DFS Volume MW']) if highest_accepted is not None else None,
-                        "last_update": datetime.now().isoformat()
-                    }
+        
+        states = {
+            "octopus_dfs_session_utilization": {
+                "state": status,
+                "attributes": {
+                    "last_checked": datetime.now().isoformat(),
                 }
-            }
-
-            # Process group data for time windows, volume, and price
-            time_window_state = None
-            time_window_attrs = {}
-            volume_state = None
-            volume_attrs = {}
-            price_state = None
-            price_attrs = {}
-            
-            if not octopus_df.empty:
-                # Sort by delivery date and time
-                octopus_df_sorted = octopus_df.sort_values(['Delivery Date', 'From'])
-                time_windows = []
-                volumes = []
-                
-                # Group entries in pairs
-                rows = octopus_df_sorted.to_dict('records')
-                for i in range(0, len(rows), 2):
-                    row1 = rows[i]
-                    row2 = rows[i + 1] if i + 1 < len(rows) else None
-                    
-                    # First entry in pair
-                    time_from1 = self._convert_to_serializable(row1['From'])
-                    time_to1 = self._convert_to_serializable(row1['To'])
-                    volume1 = self._convert_to_serializable(row1['DFS Volume MW'])
-                    
-                    if row2:
-                        # If we have a second entry, combine them
-                        time_from2 = self._convert_to_serializable(row2['From'])
-                        time_to2 = self._convert_to_serializable(row2['To'])
-                        volume2 = self._convert_to_serializable(row2['DFS Volume MW'])
-                        
-                        time_windows.append(f"{time_from1} - {time_to1}, {time_from2} - {time_to2}")
-                        volumes.append(f"{volume1}, {volume2}")
-                    else:
-                        # Just add the single entry if no pair
-                        time_windows.append(f"{time_from1} - {time_to1}")
-                        volumes.append(str(volume1))
-                
-                # Calculate average price from all bids
-                avg_price = octopus_df['Utilisation Price GBP per MWh'].mean()
-                
-                # Set states and attributes
-                time_window_state = "; ".join(time_windows)
-                time_window_attrs = {
-                    "individual_windows": [
-                        window.split(", ")
-                        for window in time_windows
-                    ]
+            },
+            "octopus_dfs_session_delivery_date": {
+                # Parsed once here and shared with the entity as a datetime
+                "state": self._to_utc_date(delivery_date),
+                "attributes": {
+                    "raw_date": delivery_date,
+                    "time_from": latest.get('From'),
+                    "time_to": latest.get('To'),
+                    "volume": octopus_latest.get('DFS Volume MW') if octopus_latest is not None else None,
+                    "last_update": datetime.now().isoformat()
                 }
-                
-                volume_state = "; ".join(volumes)
-                volume_attrs = {
-                    "individual_volumes": [
-                        [float(v.strip()) for v in volume.split(",")]
-                        for volume in volumes
-                    ]
+            },
+            "octopus_dfs_session_highest_accepted": {
+                "state": (
+                    highest_accepted['Utilisation Price GBP per MWh']
+                    if highest_accepted is not None
+                    else None
+                ),
+                "attributes": {} if highest_accepted is None else {
+                    "delivery_date": self._to_local_iso(highest_accepted['Delivery Date']),
+                    "time_from": highest_accepted.get('From'),
+                    "time_to": highest_accepted.get('To'),
+                    "volume": highest_accepted.get('DFS Volume MW'),
+                    "last_update": datetime.now().isoformat()
                 }
+            }
+        }
+
+        # Process group data for time windows, volume, and price
+        time_window_state = None
+        time_window_attrs = {}
+        volume_state = None
+        volume_attrs = {}
+        price_state = None
+        price_attrs = {}
+        
+        if octopus_rows:
+            # Sort by delivery date and time
+            rows_sorted = sorted(octopus_rows, key=self._slot_sort_key)
+            time_windows = []
+            volume_pairs = []
+            
+            # Group entries in pairs
+            for i in range(0, len(rows_sorted), 2):
+                row1 = rows_sorted[i]
+                row2 = rows_sorted[i + 1] if i + 1 < len(rows_sorted) else None
                 
-                price_state = self._convert_to_serializable(avg_price)
-                price_attrs = {
-                    "individual_prices": [
-                        self._convert_to_serializable(price)
-                        for price in octopus_df['Utilisation Price GBP per MWh'].tolist()
-                    ]
-                }
+                # First entry in pair
+                time_from1 = row1.get('From')
+                time_to1 = row1.get('To')
+                volume1 = row1.get('DFS Volume MW')
                 
-            # Add to states dictionary
-            states.update({
-                "octopus_dfs_session_time_window": {
-                    "state": time_window_state,
-                    "attributes": time_window_attrs
-                },
-                "octopus_dfs_session_price": {
-                    "state": price_state,
-                    "attributes": price_attrs
-                },
-                "octopus_dfs_session_volume": {
-                    "state": volume_state,
-                    "attributes": volume_attrs
-                }
-            })
-            
-            return states
-            
-        except Exception as e:
-            LOGGER.error(
-                "Error checking utilization from %s: %s",
-                'https://api.neso.energy/api/3/action/datastore_search_sql',
-                str(e))
-            return {
-                "octopus_dfs_session_utilization": {
-                    "state": "error",
-                    "attributes": {
-                        "last_checked": datetime.now().isoformat(),
-                        "error": str(e)
-                    }
-                }
+                if row2:
+                    # If we have a second entry, combine them
+                    time_from2 = row2.get('From')
+                    time_to2 = row2.get('To')
+                    volume2 = row2.get('DFS Volume MW')
+                    
+                    time_windows.append([f"{time_from1} - {time_to1}", f"{time_from2} - {time_to2}"])
+                    volume_pairs.append([volume1, volume2])
+                else:
+                    # Just add the single entry if no pair
+                    time_windows.append([f"{time_from1} - {time_to1}"])
+                    volume_pairs.append([volume1])
+            
+            # Set states and attributes
+            time_window_state = "; ".join(", ".join(pair) for pair in time_windows)
+            time_window_attrs = {"individual_windows": time_windows}
+            
+            # The first volume of each pair is the actual delivered volume;
+            # sensors report the most recent one
+            all_volumes = [pair[0] for pair in volume_pairs if pair[0] is not None]
+            volume_state = all_volumes[-1] if all_volumes else None
+            volume_attrs = {
+                "individual_volumes": volume_pairs,
+                "all_volumes": all_volumes,
             }
             
-    def _check_octopus_bids(self):
+            # Average, min and max across all Octopus bids in a single pass
+            individual_prices = [
+                row.get('Utilisation Price GBP per MWh') for row in octopus_rows
+            ]
+            all_prices = [price for price in individual_prices if price is not None]
+            price_attrs = {"individual_prices": individual_prices}
+            if all_prices:
+                total = 0.0
+                min_price = max_price = all_prices[0]
+                for price in all_prices:
+                    total += price
+                    if price < min_price:
+                        min_price = price
+                    elif price > max_price:
+                        max_price = price
+                price_state = total / len(all_prices)
+                price_attrs.update({
+                    "all_prices": all_prices,
+                    "price_count": len(all_prices),
+                    "min_price": min_price,
+                    "max_price": max_price,
+                })
+            
+        # Add to states dictionary
+        states.update({
+            "octopus_dfs_session_time_window": {
+                "state": time_window_state,
+                "attributes": time_window_attrs
+            },
+            "octopus_dfs_session_price": {
+                "state": price_state,
+                "attributes": price_attrs
+            },
+            "octopus_dfs_session_volume": {
+                "state": volume_state,
+                "attributes": volume_attrs
+            }
+        })
+        
+        return states
+
+    async def _async_check_octopus_bids(self):
         """Check Octopus Energy bids from NESO API."""
-        sql_query = 'SELECT COUNT(*) OVER () AS _count, * FROM "f5605e2b-b677-424c-8df7-d0ce4ee03cef" WHERE "Participant Bids Eligible" LIKE \'%OCTOPUS ENERGY LIMITED%\' ORDER BY "_id" ASC LIMIT 1000'
-        params = {'sql': sql_query}
+        # Only the cutoff date varies between polls
+        sql_query = _BIDS_SQL.format(today=datetime.now().date().isoformat())
 
         try:
             # Debug log to verify the exact query being sent
             LOGGER.debug("Sending Octopus bids SQL query: %s", sql_query)
             
-            response = requests.get('https://api.neso.energy/api/3/action/datastore_search_sql', 
-                                params=params,
-                                headers={'User-Agent': 'neso_octowatch/1.0'})
-            
-            if response.status_code == 409:
-                LOGGER.warning("API Conflict error. This might be due to rate limiting or API changes.")
-                return {}
-                
-            response.raise_for_status()
-            json_response = response.json()
+            json_response = await self._async_fetch("bids", sql_query)
             
             if not json_response.get('success'):
                 LOGGER.error("API Error: %s", json_response.get('error', 'Unknown error'))
@@ -352,88 +542,113 @@ class DfsSessionWatchCoordinator(DataUpdateCoordinator):
                 return {}
                 
             data = json_response["result"]
-            df = pd.DataFrame(data["records"])
-
-            if not df.empty:
-                # Convert and sort dates
-                df['Delivery Date'] = pd.to_datetime(df['Delivery Date'])
-                # Filter for dates from today onwards
-                today = pd.Timestamp.now().normalize()
-                future_df = df[df['Delivery Date'] >= today]
-                
-                LOGGER.debug("Bids - All dates: %s", df['Delivery Date'].unique())
-                LOGGER.debug("Bids - Future dates: %s", future_df['Delivery Date'].unique() if not future_df.empty else "None")
-            
-            states = {
-                "octopus_dfs_session_details": {
-                    "state": self._format_time_slots(df) if not df.empty else "No entries found",
-                    "attributes": {
-                        "raw_data": [{k: self._convert_to_serializable(v) for k, v in record.items()} 
-                                  for record in (df[df['Delivery Date'] == df['Delivery Date'].max()].to_dict('records') if not df.empty else [])]
-                    }
-                }
-            }
-            
-            return states
+            self._fetched_records["bids"] = data["records"]
+            return self._process_octopus_bids(data["records"])
                 
         except Exception as e:
             LOGGER.error(
                 "Error checking octopus bids from %s: %s",
-                'https://api.neso.energy/api/3/action/datastore_search_sql',
+                _API_URL,
                 str(e))
             return {
             }
             
-    def _format_time_slots(self, df):
-        """Format time slots into a readable summary, only for the most recent date."""
-        if df.empty:
-            return "No entries found"
+    def _process_octopus_bids(self, records):
+        """Build the bids summary state from the datastore records."""
+        rows = [
+            {**record, 'Delivery Date': self._parse_date(record.get('Delivery Date'))}
+            for record in records
+        ]
+
+        if rows and LOGGER.isEnabledFor(logging.DEBUG):
+            # Filter for dates from today onwards
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            dates = list(dict.fromkeys(row['Delivery Date'] for row in rows))
+            future_dates = [d for d in dates if d is not None and d >= today]
             
-        # Sort and get most recent date
-        df_sorted = df.sort_values(['Delivery Date', 'From'])
-        # Convert Delivery Date to datetime if it's not already
-        df_sorted['Delivery Date'] = pd.to_datetime(df_sorted['Delivery Date'])
-        LOGGER.debug("Available delivery dates: %s", df_sorted['Delivery Date'].unique())
-        # Try to get the nearest future date
-        future_dates = df_sorted[df_sorted['Delivery Date'] >= pd.Timestamp.now().normalize()]
-        if not future_dates.empty:
-            most_recent_date = future_dates['Delivery Date'].min()
-        else:
-            # If no future dates, get the most recent past date
-            most_recent_date = df_sorted['Delivery Date'].max()
-        LOGGER.debug("Selected delivery date: %s", most_recent_date)
-        df_recent = df_sorted[df_sorted['Delivery Date'] == most_recent_date]
+            LOGGER.debug("Bids - All dates: %s", dates)
+            LOGGER.debug("Bids - Future dates: %s", future_dates or "None")
         
-        time_slots = []
-        time_slots.append(f"\n**{most_recent_date}**")
-        
-        for _, row in df_recent.iterrows():
-            period = f"• {row['From']} - {row['To']}"
-            if pd.notna(row.get('Service Requirement MW')):
-                period += f" ({row['Service Requirement MW']} MW)"
-            if pd.notna(row.get('Guaranteed Acceptance Price GBP per MWh')):
-                period += f" with a guaranteed acceptance price of £{row['Guaranteed Acceptance Price GBP per MWh']}/MWh"
-            time_slots.append(period)
+        most_recent_date = max(
+            (row['Delivery Date'] for row in rows if row['Delivery Date'] is not None),
+            default=None,
+        )
+        states = {
+            "octopus_dfs_session_details": {
+                "state": self._format_time_slots(rows) if rows else "No entries found",
+                "attributes": {
+                    # The API records are already JSON types, so share them as-is
+                    "raw_data": [
+                        record
+                        for record, row in zip(records, rows)
+                        if most_recent_date is not None and row['Delivery Date'] == most_recent_date
+                    ]
+                }
+            }
+        }
         
-        return "\n".join(time_slots)
+        return states
+
+    def _format_time_slots(self, rows):
+        """Format time slots into a readable summary, only for the most recent date."""
+        if not rows:
+            return "No entries found"
+
+        # Key on just the fields the summary uses so unchanged polls hit the cache
+        slots = tuple(
+            (
+                row['Delivery Date'],
+                row.get('From'),
+                row.get('To'),
+                row.get('Service Requirement MW'),
+                row.get('Guaranteed Acceptance Price GBP per MWh'),
+            )
+            for row in rows
+        )
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return _build_time_slots(slots, today)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_date(value):
+        """Parse a datastore timestamp, returning None when it is missing."""
+        # Rows share a handful of delivery dates, so each string is parsed once
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _parse_float(value):
+        """Parse a datastore number, returning None when it is missing or invalid."""
+        if value is None or value == '':
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _slot_sort_key(row):
+        """Order rows by delivery date then start time, undated rows last."""
+        delivery_date = row['Delivery Date']
+        return (delivery_date is None, delivery_date or datetime.min, row.get('From') or '')
+
+    @staticmethod
+    def _to_utc_date(value):
+        """Pin a delivery date to midnight UTC, keeping its calendar date."""
+        if value is None:
+            return None
+        return value.replace(
+            hour=0, minute=0, second=0, microsecond=0, tzinfo=_UTC
+        )
 
     @staticmethod
-    def _convert_to_serializable(obj):
-        """Convert pandas/numpy types to JSON serializable types."""
-        if pd.isna(obj):
+    def _to_local_iso(value):
+        """Format a delivery date in local time without microseconds."""
+        if value is None:
             return None
-        elif isinstance(obj, (pd.Timestamp, datetime)):
-            # Ensure consistent UTC timezone
-            if obj.tzinfo is None or obj.tzinfo.utcoffset(obj) is None:
-                obj = obj.replace(tzinfo=datetime.now().astimezone().tzinfo)
-            # Convert to UTC and format without microseconds
-            LOGGER.debug("Converting timestamp: %s", obj)
-            utc_time = obj.astimezone(datetime.now().astimezone().tzinfo)
-            return utc_time.replace(microsecond=0).isoformat()
-        elif hasattr(obj, 'item'):  # This catches numpy types like int64
-            return obj.item()
-        elif isinstance(obj, dict):
-            return {k: DfsSessionWatchCoordinator._convert_to_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [DfsSessionWatchCoordinator._convert_to_serializable(v) for v in obj]
-        return obj
+        # Naive datastore timestamps are taken to be local time
+        return value.astimezone().replace(microsecond=0).isoformat()
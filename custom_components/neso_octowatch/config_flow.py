@@ -11,7 +11,7 @@ from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +33,10 @@ class DfsSessionWatchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             CONF_SCAN_INTERVAL,
                             default=DEFAULT_SCAN_INTERVAL,
                         ): int,
+                        vol.Optional(
+                            CONF_MAX_SCAN_INTERVAL,
+                            default=DEFAULT_MAX_SCAN_INTERVAL,
+                        ): int,
                     }
                 ),
             )
@@ -75,6 +79,12 @@ class DfsSessionWatchOptionsFlow(config_entries.OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): int,
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): int,
                 }
             ),
         )
\ No newline at end of file
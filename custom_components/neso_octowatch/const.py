@@ -6,6 +6,10 @@ PLATFORMS = [Platform.SENSOR]
 
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
 
+# Polling backs off up to this interval while NESO data is unchanged
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 3600  # 1 hour
+
 # Sensor types
 SENSOR_UTILIZATION = "octopus_dfs_session_utilization"
 SENSOR_DELIVERY_DATE = "octopus_dfs_session_delivery_date"
@@ -1,9 +1,8 @@
 """Platform for sensor integration."""
 from __future__ import annotations
 
-from datetime import datetime
-import zoneinfo
 import logging
+from types import MappingProxyType
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
@@ -31,20 +30,64 @@ from .const import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default so missing attributes don't allocate a new dict
+_EMPTY_ATTRIBUTES = MappingProxyType({})
+
+# Entity attributes applied per sensor type when the entity is constructed
+SENSOR_META = {
+    SENSOR_UTILIZATION: {
+        "_attr_has_entity_name": True,
+        "_attr_translation_key": "utilization",
+        "_attr_entity_registry_enabled_default": True,
+        "_attr_options": VALID_STATUSES,
+        "_attr_device_class": SensorDeviceClass.ENUM,
+        "_attr_state_class": None,
+        # Real state will be set in async_added_to_hass if data available
+        "_attr_native_value": STATUS_UNKNOWN,
+    },
+    SENSOR_DELIVERY_DATE: {
+        "_attr_device_class": SensorDeviceClass.TIMESTAMP,
+    },
+    SENSOR_TIME_WINDOW: {
+        # Text value indicating DFS session period
+        "_attr_has_entity_name": True,
+        "_attr_translation_key": "time_window",
+        "_attr_entity_registry_enabled_default": True,
+        "_attr_state_class": None,  # Text-based state, no measurement
+    },
+    SENSOR_PRICE: {
+        "_attr_native_unit_of_measurement": "GBP/MWh",
+        "_attr_device_class": SensorDeviceClass.MONETARY,
+        "_attr_state_class": SensorStateClass.MEASUREMENT,
+        "_attr_suggested_display_precision": 2,
+        "_attr_has_entity_name": True,
+        "_attr_translation_key": "average_price",
+    },
+    SENSOR_VOLUME: {
+        "_attr_native_unit_of_measurement": "MW",
+        "_attr_device_class": SensorDeviceClass.POWER,
+        "_attr_state_class": SensorStateClass.MEASUREMENT,
+        "_attr_suggested_display_precision": 1,
+    },
+    SENSOR_HIGHEST_ACCEPTED: {
+        "_attr_native_unit_of_measurement": "GBP/MWh",
+        "_attr_device_class": SensorDeviceClass.MONETARY,
+        "_attr_state_class": SensorStateClass.MEASUREMENT,
+        "_attr_suggested_display_precision": 2,
+        "_attr_has_entity_name": True,
+        "_attr_translation_key": "highest_accepted",
+    },
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Octopus DFS Session Watch sensor entities."""   
+    # The first refresh has already been awaited in __init__.async_setup_entry
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Log the setup process
-    LOGGER.debug("Setting up sensors - waiting for initial data refresh")
-    
-    # Force an initial refresh to ensure we have data before creating entities
-    await coordinator.async_config_entry_first_refresh()
-
     entities = []
     for sensor_type in [
         SENSOR_UTILIZATION,
@@ -56,63 +99,42 @@ async def async_setup_entry(
     ]:
         entities.append(DfsSessionWatchSensor(coordinator, sensor_type))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 class DfsSessionWatchSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Octopus DFS Session Watch Sensor."""
 
+    # The HA base classes keep a __dict__ for the _attr_* machinery, so only
+    # our own per-instance fields are slotted.
+    __slots__ = ("_sensor_type", "_state_handler", "_last_sensor_data", "_last_written")
+
     def __init__(self, coordinator, sensor_type):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._sensor_type = sensor_type
+        # Resolve the value processor once instead of on every update
+        self._state_handler = self._HANDLERS.get(
+            sensor_type, DfsSessionWatchSensor._process_passthrough
+        )
+        self._last_sensor_data = None
+        self._last_written = None
         self._attr_name = SENSOR_NAMES[sensor_type]
         self._attr_unique_id = f"{DOMAIN}_{sensor_type}"
         self._attr_native_unit_of_measurement = None
         self._attr_state_class = None
-        
-        # Initialize with coordinator data if available
-        if coordinator.data and sensor_type in coordinator.data:
-            self._handle_initial_state(coordinator.data[sensor_type])
 
         # Set appropriate device class and units based on sensor type
-        if sensor_type == SENSOR_UTILIZATION:
-            self._attr_has_entity_name = True
-            self._attr_translation_key = "utilization"
-            self._attr_entity_registry_enabled_default = True
-            self._attr_device_class = None  # Text-based state
-            # Initial state will be set by _handle_initial_state if data available
-        elif sensor_type == SENSOR_DELIVERY_DATE:
-            self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        elif sensor_type == SENSOR_TIME_WINDOW:
-            # Text value indicating DFS session period
-            self._attr_has_entity_name = True
-            self._attr_translation_key = "time_window"
-            self._attr_entity_registry_enabled_default = True
-            self._attr_state_class = None  # Text-based state, no measurement
-        elif sensor_type == SENSOR_PRICE:
-            self._attr_native_unit_of_measurement = "GBP/MWh"
-            self._attr_device_class = SensorDeviceClass.MONETARY
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_suggested_display_precision = 2
-            self._attr_has_entity_name = True
-            self._attr_translation_key = "average_price"
-        elif sensor_type == SENSOR_VOLUME:
-            self._attr_native_unit_of_measurement = "MW"
-            self._attr_device_class = SensorDeviceClass.POWER
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_suggested_display_precision = 1
-        elif sensor_type == SENSOR_HIGHEST_ACCEPTED:
-            self._attr_native_unit_of_measurement = "GBP/MWh"
-            self._attr_device_class = SensorDeviceClass.MONETARY
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-            self._attr_suggested_display_precision = 2
-            self._attr_has_entity_name = True
-            self._attr_translation_key = "highest_accepted"
-        
-        if sensor_type == SENSOR_UTILIZATION:
-            self._attr_options = VALID_STATUSES
-            self._attr_device_class = SensorDeviceClass.ENUM
-            self._attr_state_class = None
+        for attr, value in SENSOR_META.get(sensor_type, {}).items():
+            setattr(self, attr, value)
+
+    async def async_added_to_hass(self) -> None:
+        """Populate the initial state from the already refreshed coordinator."""
+        await super().async_added_to_hass()
+        data = self.coordinator.data
+        if data and self._sensor_type in data:
+            self._handle_initial_state(data[self._sensor_type])
+        # Home Assistant writes this state once the entity has been added
+        self._last_written = self._state_snapshot()
 
     def _handle_initial_state(self, sensor_data: dict) -> None:
         """Handle the initial state setup for the sensor."""
@@ -120,205 +142,98 @@ class DfsSessionWatchSensor(CoordinatorEntity, SensorEntity):
             self._attr_native_value = None
             return
 
+        # The coordinator builds a fresh payload on every refresh, so seeing the
+        # same object again means there is nothing new to parse
+        if sensor_data is self._last_sensor_data:
+            return
+        self._last_sensor_data = sensor_data
+
         state_value = sensor_data.get("state")
-        
+        attributes = sensor_data.get("attributes", _EMPTY_ATTRIBUTES)
+        # Processors below may extend these with derived attributes. Equal
+        # attributes keep the previous object so the write check in
+        # _handle_coordinator_update can short-circuit on identity.
+        if attributes != getattr(self, "_attr_extra_state_attributes", None):
+            self._attr_extra_state_attributes = attributes
+
         # Process value based on sensor type
-        if self._sensor_type == SENSOR_UTILIZATION:
-            self._attr_native_value = state_value if state_value in VALID_STATUSES else STATUS_UNKNOWN
-        
-        elif self._sensor_type == SENSOR_DELIVERY_DATE:
-            self._process_delivery_date(state_value)
-        
-        elif self._sensor_type == SENSOR_TIME_WINDOW:
-            self._process_time_window(state_value, sensor_data.get("attributes", {}))
-        
-        elif self._sensor_type == SENSOR_VOLUME:
-            self._process_volume(state_value, sensor_data.get("attributes", {}))
-        
-        elif self._sensor_type == SENSOR_PRICE:
-            self._process_price(state_value, sensor_data.get("attributes", {}))
-            
-        elif self._sensor_type == SENSOR_HIGHEST_ACCEPTED:
-            try:
-                self._attr_native_value = float(state_value) if state_value is not None else None
-            except (ValueError, TypeError):
-                self._attr_native_value = None
-        
-        else:  # Default handling for other sensors
-            self._attr_native_value = state_value
-        
-        self._attr_extra_state_attributes = sensor_data.get("attributes", {})
+        self._state_handler(self, state_value, attributes)
 
-    def _process_delivery_date(self, state_value: str | None) -> None:
-        """Process delivery date value."""
-        if not isinstance(state_value, str):
-            self._attr_native_value = None
-            return
-            
-        try:
-            clean_value = state_value.split('+')[0].strip().split('.')[0].strip()
-            try:
-                dt = datetime.fromisoformat(clean_value)
-            except ValueError:
-                try:
-                    dt = datetime.strptime(clean_value, "%Y-%m-%d")
-                except ValueError:
-                    dt = datetime.strptime(clean_value, "%d %B %Y")
-            dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            self._attr_native_value = dt.replace(tzinfo=zoneinfo.ZoneInfo("UTC"))
-        except ValueError:
-            self._attr_native_value = None
+    def _process_utilization(self, state_value: str | None, attributes: dict) -> None:
+        """Process utilization status value."""
+        self._attr_native_value = state_value if state_value in VALID_STATUSES else STATUS_UNKNOWN
 
     def _process_time_window(self, state_value: str | None, attributes: dict) -> None:
         """Process time window value."""
         if isinstance(state_value, str) and ';' in state_value:
-            values = [v.strip() for v in state_value.split(';')]
-            if values:
-                self._attr_native_value = values[-1]  # Use most recent
-                self._attr_extra_state_attributes = {
-                    **attributes,
-                    'all_time_windows': values
-                }
-            else:
-                self._attr_native_value = STATUS_UNKNOWN
+            # Use most recent without splitting the whole string for the state
+            self._attr_native_value = state_value.rpartition(';')[2].strip() or STATUS_UNKNOWN
+            self._attr_extra_state_attributes = {
+                **attributes,
+                'all_time_windows': [v.strip() for v in state_value.split(';')]
+            }
         else:
             self._attr_native_value = state_value if isinstance(state_value, str) and state_value.strip() else STATUS_UNKNOWN
 
-    def _process_price(self, state_value: str | None, attributes: dict) -> None:
-        """Process price values and calculate average for the day."""
-        if state_value == STATUS_UNKNOWN:
-            self._attr_native_value = None
-            return
-            
-        try:
-            # Get all prices from all sessions
-            all_prices = []
-            
-            if isinstance(state_value, str):
-                if ';' in state_value:
-                    # Multiple sessions - split and process each one
-                    sessions = [s.strip() for s in state_value.split(';') if s.strip()]
-                    for session in sessions:
-                        if ',' in session:
-                            # Multiple prices in this session
-                            session_prices = [float(p.strip()) for p in session.split(',') if p.strip()]
-                            all_prices.extend(session_prices)
-                        else:
-                            # Single price in this session
-                            try:
-                                price = float(session.strip())
-                                all_prices.append(price)
-                            except (ValueError, TypeError):
-                                continue
-                elif ',' in state_value:
-                    # Single session with multiple prices
-                    all_prices = [float(p.strip()) for p in state_value.split(',') if p.strip()]
-                else:
-                    # Single price
-                    try:
-                        all_prices = [float(state_value.strip())]
-                    except (ValueError, TypeError):
-                        pass
-                        
-            if all_prices:
-                # Calculate average of all prices
-                self._attr_native_value = sum(all_prices) / len(all_prices)
-                self._attr_extra_state_attributes = {
-                    **attributes,
-                    'all_prices': all_prices,
-                    'price_count': len(all_prices),
-                    'min_price': min(all_prices),
-                    'max_price': max(all_prices)
-                }
-            else:
-                self._attr_native_value = None
-        except (ValueError, TypeError):
-            self._attr_native_value = None
+    def _process_passthrough(self, state_value: float | None, attributes: dict) -> None:
+        """Use a value the coordinator has already computed."""
+        self._attr_native_value = state_value
 
-    def _process_volume(self, state_value: str | None, attributes: dict) -> None:
-        """Process volume value."""
-        if state_value == STATUS_UNKNOWN:
-            self._attr_native_value = None
-            return
-            
-        try:
-            if isinstance(state_value, str) and ';' in state_value:
-                pairs = [pair.strip() for pair in state_value.split(';') if pair.strip()]
-                values = []
-                for pair in pairs:
-                    if ',' in pair:
-                        actual = pair.split(',')[0].strip()
-                        values.append(float(actual))
-                
-                if values:
-                    self._attr_native_value = values[-1]  # Use most recent
-                    self._attr_extra_state_attributes = {
-                        **attributes,
-                        'all_volumes': values
-                    }
-                else:
-                    self._attr_native_value = None
-            elif state_value and str(state_value).strip():
-                if ',' in str(state_value):
-                    actual = str(state_value).split(',')[0].strip()
-                    self._attr_native_value = float(actual)
-                else:
-                    self._attr_native_value = float(str(state_value).strip())
-            else:
-                self._attr_native_value = None
-        except (ValueError, TypeError):
-            self._attr_native_value = None
+    _HANDLERS = {
+        SENSOR_UTILIZATION: _process_utilization,
+        SENSOR_TIME_WINDOW: _process_time_window,
+    }
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data is None:
-            self._attr_extra_state_attributes = {}
-            self._attr_native_value = None
+        self._update_from_coordinator()
+
+        # Skip the write when nothing visible changed since the last one
+        snapshot = self._state_snapshot()
+        if snapshot == self._last_written:
             return
-        
-        key = self._sensor_type
-        if key not in self.coordinator.data:
-            if (self._sensor_type == SENSOR_DELIVERY_DATE and
-                "octopus_dfs_session_highest_accepted" in self.coordinator.data):
-                # Try to get delivery date from highest accepted attributes
-                highest_accepted = self.coordinator.data["octopus_dfs_session_highest_accepted"]
-                if "attributes" in highest_accepted:
-                    delivery_date = highest_accepted["attributes"].get("delivery_date")
-                    if delivery_date:
-                        self._process_delivery_date(delivery_date)
-            else:
-                self._attr_extra_state_attributes = {}
-                self._attr_native_value = None
+        self._last_written = snapshot
+        # Let CoordinatorEntity write the state
+        super()._handle_coordinator_update()
+
+    def _state_snapshot(self) -> tuple:
+        """Return the parts of the entity state that a write would publish."""
+        return (
+            self.available,
+            self._attr_native_value,
+            getattr(self, "_attr_extra_state_attributes", None),
+        )
+
+    def _update_from_coordinator(self) -> None:
+        """Apply the latest coordinator data to the entity attributes."""
+        # Single lookup into the coordinator data for this sensor
+        data = self.coordinator.data
+        sensor_data = data.get(self._sensor_type) if data is not None else None
+        if sensor_data is None:
+            self._last_sensor_data = None
+            self._attr_extra_state_attributes = _EMPTY_ATTRIBUTES
+            self._attr_native_value = None
             return
 
         # Use the same processing logic as initial state
-        self._handle_initial_state(self.coordinator.data[key])
-        
-        # Log debug information for certain sensors
-        if self._sensor_type == SENSOR_UTILIZATION:
-            LOGGER.debug("Setting utilization state to: %s", self._attr_native_value)
-        elif self._sensor_type == SENSOR_HIGHEST_ACCEPTED:
-            LOGGER.debug("Setting highest accepted bid value to: %s", self._attr_native_value)
-        elif self._sensor_type == SENSOR_VOLUME:
-            LOGGER.debug("Setting volume value to: %s", self._attr_native_value)
-        elif self._sensor_type == SENSOR_PRICE:
-            LOGGER.debug("Setting daily average price to: %s", self._attr_native_value)
-            if hasattr(self, '_attr_extra_state_attributes'):
-                attrs = self._attr_extra_state_attributes
-                if 'price_count' in attrs:
-                    LOGGER.debug("Daily price range: %s - %s (average from %d prices)",
-                                attrs.get('min_price'),
-                                attrs.get('max_price'),
-                                attrs['price_count'])
+        self._handle_initial_state(sensor_data)
         
-        self.async_write_ha_state()
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Setting %s value to: %s", self._sensor_type, self._attr_native_value)
+            attrs = getattr(self, '_attr_extra_state_attributes', None) or {}
+            if 'price_count' in attrs:
+                LOGGER.debug("Daily price range: %s - %s (average from %d prices)",
+                            attrs.get('min_price'),
+                            attrs.get('max_price'),
+                            attrs['price_count'])
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        data = self.coordinator.data
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self._sensor_type in self.coordinator.data
+            and data is not None
+            and self._sensor_type in data
         )
\ No newline at end of file